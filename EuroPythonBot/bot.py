@@ -22,9 +22,11 @@ _logger = logging.getLogger("bot")
 class Bot(commands.Bot):
     def __init__(self):
         intents = _get_intents()
-        super().__init__(command_prefix=commands.when_mentioned_or("$"), intents=intents)
-        self.guild = None
-        self.channels = dict()
+        super().__init__(
+            command_prefix=commands.when_mentioned_or("$"),
+            intents=intents,
+            max_messages=None,  # the bot never reads cached messages
+        )
 
     async def on_ready(self):
         _logger.info("Logged in as user %r (ID=%r)", self.user.name, self.user.id)
@@ -60,14 +62,13 @@ def _setup_logging() -> None:
 
 
 def _get_intents() -> discord.Intents:
-    """Get the desired intents for the bot."""
-    intents = discord.Intents.all()
-    intents.presences = False
-    intents.dm_typing = False
-    intents.dm_reactions = False
-    intents.invites = False
-    intents.integrations = False
-    return intents
+    """Get the desired intents for the bot.
+
+    Only subscribe to the gateway events the bot uses: guild state
+    (channels, roles), members (registration, statistics) and messages
+    with their content (prefix commands).
+    """
+    return discord.Intents(guilds=True, members=True, messages=True, message_content=True)
 
 
 async def main():
@@ -22,7 +22,6 @@ class Config(metaclass=Singleton):
 
     def __init__(self):
         # Configuration file
-        config = None
         self.BASE_PATH = Path(__file__).resolve().parent
         self.CONFIG_PATH = self._get_config_path(self.BASE_PATH)
         with self.CONFIG_PATH.open("rb") as f:
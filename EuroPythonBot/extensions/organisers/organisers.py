@@ -1,5 +1,6 @@
 """Commands for organisers."""
 
+import collections
 import logging
 
 import attrs
@@ -45,18 +46,27 @@ class Organisers(commands.Cog):
         :param guild: The guild instance providing the information
         :return: Counts of different roles and pseudo-roles
         """
+        # count all roles in a single pass over the members, instead of one pass per role
+        # (Role.members), using the raw role id lists instead of resolving Role objects
+        # (Member.roles); unlike Member.roles, the id lists do not contain @everyone
+        member_counts_by_role_id = collections.Counter()
+        not_registered = 0
+        for member in guild.members:
+            member_counts_by_role_id.update(member._roles)
+            not_registered += not member._roles
+
         return _RoleCount(
             everyone=guild.member_count,
-            not_registered=sum(len(m.roles) == 1 for m in guild.members),
+            not_registered=not_registered,
             **{
-                role: len(guild.get_role(role_id).members)
+                role: member_counts_by_role_id[role_id]
                 for role, role_id in attrs.asdict(self._roles).items()
             },
         )
 
     async def cog_check(self, ctx: commands.Context) -> bool:
         """Check if the message author has the organisers role."""
-        return any(role.id == self._roles.organisers for role in ctx.author.roles)
+        return ctx.author.get_role(self._roles.organisers) is not None
 
     async def cog_command_error(self, ctx: commands.Context, error: Exception) -> None:
         """Handle a command error raised in this class."""
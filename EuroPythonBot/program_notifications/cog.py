@@ -1,6 +1,7 @@
+import asyncio
 import logging
 
-from discord import Client, Embed
+from discord import Client, DiscordServerError, Embed, HTTPException, TextChannel
 from discord.ext import commands, tasks
 
 from configuration import Config
@@ -26,17 +27,27 @@ class ProgramNotificationsCog(commands.Cog):
 
         self.livestream_connector = LivestreamConnector(config.LIVESTREAM_URL_FILE)
 
+        # like {'forum_hall': 123456}, resolved once instead of on every notification
+        self._channel_ids_by_room: dict[str, int] = {
+            room: int(details["channel_id"]) for room, details in config.PROGRAM_CHANNELS.items()
+        }
+
         self.notified_sessions = set()
         _logger.info("Cog 'Program Notifications' has been initialized")
 
     @commands.Cog.listener()
     async def on_ready(self):
+        # on_ready is dispatched again after reconnects, but the notifier keeps running
+        if self.notify_sessions.is_running():
+            _logger.info("Session notifier is already running, nothing to do.")
+            return
+
         if config.SIMULATED_START_TIME:
             _logger.info("Running in simulated time mode.")
             _logger.info("Will purge all room channels to avoid pile-up of test notifications.")
             await self.purge_all_room_channels()
-            _logger.debug(f"Simulated start time: {config.SIMULATED_START_TIME}")
-            _logger.debug(f"Fast mode: {config.FAST_MODE}")
+            _logger.debug("Simulated start time: %s", config.SIMULATED_START_TIME)
+            _logger.debug("Fast mode: %s", config.FAST_MODE)
         _logger.info("Starting the session notifier...")
         self.notify_sessions.start()
         _logger.info("Cog 'Program Notifications' is ready")
@@ -50,6 +61,8 @@ class ProgramNotificationsCog(commands.Cog):
         )
         self.fetch_schedule.start()
         self.fetch_livestreams.start()
+        # retry with exponential backoff instead of stopping the notifier on Discord outages
+        self.notify_sessions.add_exception_type(DiscordServerError)
         self.notify_sessions.change_interval(
             seconds=2 if config.FAST_MODE and config.SIMULATED_START_TIME else 60
         )
@@ -75,20 +88,39 @@ class ProgramNotificationsCog(commands.Cog):
         await self.livestream_connector.fetch_livestreams()
         _logger.info("Finished the periodic livestream update.")
 
+    def _get_room_channel(self, room: str) -> TextChannel:
+        """
+        Get the channel of a room by its name
+        """
+        return self.bot.get_channel(self._channel_ids_by_room[room.lower().replace(" ", "_")])
+
     async def set_room_topic(self, room, topic: str):
         """
         Set the topic of a room channel
         """
-        channel_id = config.PROGRAM_CHANNELS[room.lower().replace(" ", "_")]["channel_id"]
-        channel = self.bot.get_channel(int(channel_id))
+        channel = self._get_room_channel(room)
+        # Discord reports an empty topic as None
+        if (channel.topic or "") == topic:
+            return
         await channel.edit(topic=topic)
 
+    async def _try_set_room_topic(self, room: str, topic: str) -> None:
+        """
+        Set the topic of a room channel, logging instead of raising errors
+
+        The notifications are sent regardless, so a failed topic update must not cause the
+        session to be notified again.
+        """
+        try:
+            await self.set_room_topic(room, topic)
+        except HTTPException:
+            _logger.exception("Failed to set the topic of room %r", room)
+
     async def notify_room(self, room: str, embed: Embed, content: str = None):
         """
         Send the given notification to the room channel
         """
-        channel_id = config.PROGRAM_CHANNELS[room.lower().replace(" ", "_")]["channel_id"]
-        channel = self.bot.get_channel(int(channel_id))
+        channel = self._get_room_channel(room)
         await channel.send(content=content, embed=embed)
 
     @tasks.loop()
@@ -107,34 +139,46 @@ class ProgramNotificationsCog(commands.Cog):
                 session.rooms[0], session.start.date()
             )
 
-            # Set the channel topic
-            await self.set_room_topic(
-                session.rooms[0],
-                f"Livestream: [YouTube]({livestream_url})" if livestream_url else "",
+            # Set the channel topic while the notifications are sent
+            set_topic_task = asyncio.create_task(
+                self._try_set_room_topic(
+                    session.rooms[0],
+                    f"Livestream: [YouTube]({livestream_url})" if livestream_url else "",
+                )
             )
 
-            embed = session_to_embed.create_session_embed(session, livestream_url)
-
-            # # Notify specific rooms
-            # for room in session.rooms:
-            await self.notify_room(
-                session.rooms[0], embed, content=f"# Starting in 5 minutes @ {session.rooms[0]}"
-            )
+            try:
+                embed = session_to_embed.create_session_embed(session, livestream_url)
 
-            # Prefix the first message to the main channel with a header
-            if first_message:
+                # # Notify specific rooms
+                # for room in session.rooms:
                 await self.notify_room(
-                    "Main Channel", embed, content="# Sessions starting in 5 minutes:"
+                    session.rooms[0],
+                    embed,
+                    content=f"# Starting in 5 minutes @ {session.rooms[0]}",
                 )
-                first_message = False
-            else:
-                await self.notify_room("Main Channel", embed)
+
+                # Prefix the first message to the main channel with a header
+                if first_message:
+                    await self.notify_room(
+                        "Main Channel", embed, content="# Sessions starting in 5 minutes:"
+                    )
+                    first_message = False
+                else:
+                    await self.notify_room("Main Channel", embed)
+            finally:
+                # do not leave the topic update running unobserved if a notification failed
+                await set_topic_task
 
             self.notified_sessions.add(session)
 
     async def purge_all_room_channels(self):
         _logger.info("Purging all room channels...")
-        for room in config.PROGRAM_CHANNELS.values():
-            channel = self.bot.get_channel(int(room["channel_id"]))
-            await channel.purge()
+        # the channels are independent, so purge them concurrently
+        await asyncio.gather(
+            *(
+                self.bot.get_channel(channel_id).purge()
+                for channel_id in self._channel_ids_by_room.values()
+            )
+        )
         _logger.info("Purged all room channels channels.")
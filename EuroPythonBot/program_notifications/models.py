@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+from typing import Annotated, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class DaySchedule(BaseModel):
     """Schedule of a single day of EuroPython"""
 
     rooms: list[str]
-    events: list[Session | Break]
+    events: list[Annotated[Session | Break, Field(discriminator="event_type")]]
 
 
 class Schedule(BaseModel):
@@ -21,7 +22,7 @@ class Schedule(BaseModel):
 class Break(BaseModel):
     """Break in the EuroPython schedule"""
 
-    event_type: str
+    event_type: Literal["break"]
     title: str
     duration: int
     rooms: list[str]
@@ -31,7 +32,7 @@ class Break(BaseModel):
 class Session(BaseModel):
     """Session in the EuroPython schedule"""
 
-    event_type: str
+    event_type: Literal["session"]
     code: str
     slug: str
     title: str
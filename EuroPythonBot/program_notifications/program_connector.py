@@ -65,7 +65,7 @@ class ProgramConnector:
                         schedule = await response.json()
 
             except aiohttp.ClientError as e:
-                _logger.warning(f"Error fetching schedule: {e}.")
+                _logger.warning("Error fetching schedule: %s.", e)
 
                 if self.sessions_by_day is not None:
                     _logger.info("Schedule not updated, using the one loaded in memory.")
@@ -78,7 +78,7 @@ class ProgramConnector:
             _logger.info("Schedule fetched successfully.")
 
             # write schedule to file in case the API goes down
-            _logger.info(f"Writing schedule to {self._cache_file}...")
+            _logger.info("Writing schedule to %s...", self._cache_file)
             Path(self._cache_file).parent.mkdir(exist_ok=True, parents=True)
             async with aiofiles.open(self._cache_file, "w") as f:
                 await f.write(json.dumps(schedule, indent=2))
@@ -92,7 +92,7 @@ class ProgramConnector:
         Get the schedule data from the cache file.
         """
         try:
-            _logger.info(f"Getting schedule from cache file {self._cache_file}...")
+            _logger.info("Getting schedule from cache file %s...", self._cache_file)
             async with aiofiles.open(self._cache_file, "r") as f:
                 schedule = json.loads(await f.read())
 
@@ -121,7 +121,7 @@ class ProgramConnector:
         except KeyError:
             # debug to keep the logs clean,
             # because this is expected on non-conference days
-            _logger.debug(f"No sessions found on {date_now}")
+            _logger.debug("No sessions found on %s", date_now)
         except TypeError:
             _logger.error("Schedule data is not loaded.")
 
@@ -133,7 +133,7 @@ class ProgramConnector:
         now = await self._get_now()
 
         if self._simulated_start_time:
-            _logger.debug(f"Simulated time now: {now}")
+            _logger.debug("Simulated time now: %s", now)
 
         sessions = await self.get_sessions_by_date(now.date())
 
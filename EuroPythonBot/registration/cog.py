@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import textwrap
@@ -16,6 +17,29 @@ config = Config()
 
 _logger = logging.getLogger(f"bot.{__name__}")
 
+_WELCOME_MESSAGE_BODY = textwrap.dedent(
+    f"""
+    Follow these steps to complete your registration:
+
+    1️⃣ Click on the green "Register here 👈" button below.
+
+    2️⃣ Fill in your Order ID and the name on your ticket. You can find them
+    * Printed on your ticket
+    * Printed on your badge
+    * In the email "[EuroPython 2024] Your order: XXXXX" from support@pretix.eu
+
+    3️⃣ Click "Submit".
+
+    These steps will assign the correct server permissions and set your server nickname.
+
+    Experiencing trouble? Please contact us
+    * In the <#{config.REG_HELP_CHANNEL_ID}> channel
+    * By speaking to a volunteer in a yellow t-shirt
+
+    Enjoy our EuroPython 2024 Community Server! 🐍💻🎉
+    """
+)
+
 
 class RegistrationButton(discord.ui.Button["Registration"]):
     def __init__(self, parent_cog: RegistrationCog):
@@ -55,7 +79,7 @@ class RegistrationForm(discord.ui.Modal, title="EuroPython 2024 Registration"):
         name = self.name_field.value
         order = self.order_field.value
 
-        _logger.debug(f"Registration attempt: {order=}, {name=}")
+        _logger.debug("Registration attempt: order=%r, name=%r", order, name)
         tickets = self.parent_cog.pretix_connector.get_tickets(order=order, name=name)
 
         if not tickets:
@@ -64,13 +88,13 @@ class RegistrationForm(discord.ui.Modal, title="EuroPython 2024 Registration"):
                 "We cannot find your ticket. Please double check your input and try again.",
             )
             await self.log_error_to_channel(interaction, f"No ticket found: {order=}, {name=}")
-            _logger.info(f"No ticket found: {order=}, {name=}")
+            _logger.info("No ticket found: order=%r, name=%r", order, name)
             return
 
         if any(self.parent_cog.registration_logger.is_registered(ticket) for ticket in tickets):
             await self.log_error_to_user(interaction, "You have already registered.")
             await self.log_error_to_channel(interaction, f"Already registered: {order=}, {name=}")
-            _logger.info(f"Already registered: {tickets}")
+            _logger.info("Already registered: %s", tickets)
             return
 
         role_ids = set()
@@ -83,22 +107,36 @@ class RegistrationForm(discord.ui.Modal, title="EuroPython 2024 Registration"):
         if not role_ids:
             await self.log_error_to_user(interaction, "No ticket found.")
             await self.log_error_to_channel(interaction, f"Tickets without roles: {tickets}")
-            _logger.info(f"Tickets without role assignments: {tickets}")
+            _logger.info("Tickets without role assignments: %s", tickets)
             return
 
         nickname = tickets[0].name[:32]  # Limit to the max length
+        roles = [interaction.guild.get_role(role_id) for role_id in role_ids]
         _logger.info("Assigning nickname %r", nickname)
         await interaction.user.edit(nick=nickname)
 
-        roles = [discord.utils.get(interaction.guild.roles, id=role_id) for role_id in role_ids]
-        _logger.info("Assigning %r role_ids=%r", name, role_ids)
-        await interaction.user.add_roles(*roles)
+        # add the roles one by one instead of replacing the member's role list with a single
+        # request, which could drop roles granted in the meantime, but skip the ones it has
+        missing_roles = [role for role in roles if interaction.user.get_role(role.id) is None]
+        _logger.info("Assigning %r role_ids=%r", name, [role.id for role in missing_roles])
+        if missing_roles:
+            await interaction.user.add_roles(*missing_roles)
+
+        channel_result, user_result = await asyncio.gather(
+            self.log_registration_to_channel(interaction, name=name, order=order, roles=roles),
+            self.log_registration_to_user(interaction, name=name),
+            return_exceptions=True,
+        )
+        # the user may already be told about the registration, so on_error cannot respond
+        if isinstance(channel_result, BaseException):
+            _logger.error("Failed to log the registration to the channel", exc_info=channel_result)
 
-        await self.log_registration_to_channel(interaction, name=name, order=order, roles=roles)
-        await self.log_registration_to_user(interaction, name=name)
+        # the roles were assigned, so the tickets are registered even if responding failed
         for ticket in tickets:
             await self.parent_cog.registration_logger.mark_as_registered(ticket)
-        _logger.info(f"Registration successful: {order=}, {name=}")
+        if isinstance(user_result, BaseException):
+            raise user_result
+        _logger.info("Registration successful: order=%r, name=%r", order, name)
 
     async def on_error(self, interaction: Interaction, error: Exception) -> None:
         user_is_admin = any(role.name == "Admin" for role in interaction.user.roles)
@@ -165,41 +203,15 @@ class RegistrationCog(commands.Cog):
 
     @commands.Cog.listener()
     async def on_ready(self):
-        reg_channel = self.bot.get_channel(config.REG_CHANNEL_ID)
-
-        await reg_channel.purge()
         await self.pretix_connector.fetch_pretix_data()
 
         view = discord.ui.View(timeout=None)  # timeout=None to make it persistent
         view.add_item(RegistrationButton(parent_cog=self))
 
-        welcome_message = create_welcome_message(
-            textwrap.dedent(
-                f"""
-                Follow these steps to complete your registration:
-
-                1️⃣ Click on the green "Register here 👈" button below.
-
-                2️⃣ Fill in your Order ID and the name on your ticket. You can find them
-                * Printed on your ticket
-                * Printed on your badge
-                * In the email "[EuroPython 2024] Your order: XXXXX" from support@pretix.eu
-
-                3️⃣ Click "Submit".
-
-                These steps will assign the correct server permissions and set your server nickname.
-
-                Experiencing trouble? Please contact us
-                * In the <#{config.REG_HELP_CHANNEL_ID}> channel
-                * By speaking to a volunteer in a yellow t-shirt
-
-                Enjoy our EuroPython 2024 Community Server! 🐍💻🎉
-                """
-            )
+        await self.replace_registration_message(
+            create_welcome_message(_WELCOME_MESSAGE_BODY), view=view
         )
 
-        await reg_channel.send(embed=welcome_message, view=view)
-
     async def cog_load(self) -> None:
         """Load the initial schedule."""
         _logger.info("Scheduling periodic pretix update task.")
@@ -209,17 +221,35 @@ class RegistrationCog(commands.Cog):
         """Load the initial schedule."""
         _logger.info("Canceling periodic pretix update task.")
         self.fetch_pretix_updates.cancel()
+        await self.pretix_connector.close()
 
         _logger.info("Replacing registration form with 'currently offline' message")
-        reg_channel = self.bot.get_channel(config.REG_CHANNEL_ID)
-        await reg_channel.purge()
-        await reg_channel.send(
-            embed=create_welcome_message(
+        await self.replace_registration_message(
+            create_welcome_message(
                 "The registration bot is currently offline. "
                 "We apologize for the inconvenience and are working hard to fix the issue."
             )
         )
 
+    async def replace_registration_message(
+        self, embed: discord.Embed, *, view: discord.ui.View | None = None
+    ) -> None:
+        """Make the given embed the only message in the registration channel.
+
+        If the channel only contains a previous message of the bot, that
+        message is edited in place. Otherwise, the channel is purged and
+        a new message is sent.
+        """
+        reg_channel = self.bot.get_channel(config.REG_CHANNEL_ID)
+
+        messages = [message async for message in reg_channel.history(limit=2)]
+        if len(messages) == 1 and messages[0].author == self.bot.user:
+            await messages[0].edit(embed=embed, view=view)
+            return
+
+        await reg_channel.purge()
+        await reg_channel.send(embed=embed, view=view)
+
     @tasks.loop(minutes=5)
     async def fetch_pretix_updates(self):
         _logger.info("Starting the periodic pretix update...")
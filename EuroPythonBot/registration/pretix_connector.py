@@ -1,26 +1,39 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import itertools
 import logging
+import math
 import time
 from collections import defaultdict
+from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Final
 
 import aiofiles
 import aiohttp
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json
 
 from registration.pretix_api_response_models import PretixItem, PretixOrder
-from registration.ticket import Ticket, generate_ticket_key
+from registration.ticket import Ticket, generate_lookup_key, generate_ticket_key
 
 _logger = logging.getLogger(f"bot.{__name__}")
 
+_MAX_CONCURRENT_PAGE_FETCHES: Final = 8
+_KEEPALIVE_TIMEOUT_SECONDS: Final = 6 * 60
+_DNS_CACHE_TTL_SECONDS: Final = 600
+
+# validate whole API responses in a single call
+_ITEMS_ADAPTER: Final = TypeAdapter(list[PretixItem])
+_ORDERS_ADAPTER: Final = TypeAdapter(list[PretixOrder])
+
 
 class PretixCache(BaseModel):
     item_names_by_id: dict[int, str]
-    tickets_by_key: dict[str, list[Ticket]]
+    tickets_by_key: dict[str, tuple[Ticket, ...]]
 
 
 class PretixConnector:
@@ -29,6 +42,7 @@ class PretixConnector:
 
         # https://docs.pretix.eu/en/latest/api/tokenauth.html#using-an-api-token
         self._http_headers = {"Authorization": f"Token {token}"}
+        self._session: aiohttp.ClientSession | None = None
 
         self._fetch_lock = asyncio.Lock()
         self._last_fetch: datetime | None = None
@@ -36,7 +50,9 @@ class PretixConnector:
         self._cache_file = cache_file
 
         self.item_names_by_id: dict[int, str] = {}
-        self.tickets_by_key: dict[str, list[Ticket]] = defaultdict(list)
+        # most keys map to a single ticket, tuples are more compact than lists
+        self.tickets_by_key: dict[str, tuple[Ticket, ...]] = {}
+        self._keys_by_order: dict[str, set[str]] = defaultdict(set)
 
         self._load_cache()
 
@@ -51,6 +67,28 @@ class PretixConnector:
         cache = PretixCache.model_validate_json(file_content)
         self.item_names_by_id = cache.item_names_by_id
         self.tickets_by_key = cache.tickets_by_key
+        for key, tickets in self.tickets_by_key.items():
+            for ticket in tickets:
+                self._keys_by_order[ticket.order].add(key)
+
+    async def close(self) -> None:
+        """Close the HTTP session, if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session, which keeps connections to Pretix alive between fetches."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=_MAX_CONCURRENT_PAGE_FETCHES,
+                # outlive the five minutes between periodic fetches (RegistrationCog),
+                # so the connection to Pretix is reused instead of reopened
+                keepalive_timeout=_KEEPALIVE_TIMEOUT_SECONDS,
+                ttl_dns_cache=_DNS_CACHE_TTL_SECONDS,
+            )
+            self._session = aiohttp.ClientSession(headers=self._http_headers, connector=connector)
+        return self._session
 
     async def fetch_pretix_data(self) -> None:
         """Fetch order and item data from the Pretix API and cache it."""
@@ -59,15 +97,23 @@ class PretixConnector:
             # ... but does not trigger a second fetch
             now = datetime.now(tz=timezone.utc)
             if self._last_fetch and now - self._last_fetch < timedelta(minutes=2):
-                _logger.info(f"Skipping pretix fetch (last fetch was at {self._last_fetch})")
+                _logger.info("Skipping pretix fetch (last fetch was at %s)", self._last_fetch)
                 return
 
+            previous_item_names_by_id = dict(self.item_names_by_id)
             await self._fetch_pretix_items()
-            await self._fetch_pretix_orders(since=self._last_fetch)
-
-            if self._cache_file is not None:
+            order_count = await self._fetch_pretix_orders(since=self._last_fetch)
+
+            # only rewrite the cache file if something changed since the last fetch
+            data_changed = (
+                self._last_fetch is None
+                or order_count > 0
+                or self.item_names_by_id != previous_item_names_by_id
+            )
+            if self._cache_file is not None and data_changed:
                 async with aiofiles.open(self._cache_file, "w") as f:
-                    cache = PretixCache(
+                    # the data was validated on fetch, so skip re-validating all tickets
+                    cache = PretixCache.model_construct(
                         item_names_by_id=self.item_names_by_id,
                         tickets_by_key=self.tickets_by_key,
                     )
@@ -75,10 +121,12 @@ class PretixConnector:
 
             self._last_fetch = now
 
-    async def _fetch_pretix_orders(self, since: datetime | None = None) -> None:
+    async def _fetch_pretix_orders(self, since: datetime | None = None) -> int:
+        """Fetch orders from the Pretix API and return the number of fetched orders."""
         # initially fetch all orders, then only fetch updates
         params = {"testmode": "false"}
-        if since is None or not self.tickets_by_key:
+        fetch_all = since is None or not self.tickets_by_key
+        if fetch_all:
             _logger.info("Fetching all pretix orders")
         else:
             _logger.info("Fetching pretix orders since %s", since)
@@ -88,9 +136,21 @@ class PretixConnector:
             f"{self._pretix_api_url}/orders",
             params=params,
         )
+        order_count = len(orders_as_json)
+
+        if fetch_all:
+            # rebuild from scratch, dropping stale entries (e.g. loaded from the cache file)
+            self.tickets_by_key = {}
+            self._keys_by_order = defaultdict(set)
+
+        for order in _ORDERS_ADAPTER.validate_python(orders_as_json):
+            # modified orders are fetched again with all their positions, so drop their
+            # previous tickets (e.g. with a changed variation or name, or cancelled)
+            for key in self._keys_by_order.pop(order.id, ()):
+                self.tickets_by_key.pop(key, None)
 
-        for order_as_json in orders_as_json:
-            order = PretixOrder(**order_as_json)
+            if not order.is_paid:
+                continue
 
             for position in order.positions:
                 # skip positions without name (e.g. childcare, T-shirt)
@@ -110,18 +170,21 @@ class PretixConnector:
                     type=item_name,
                     variation=variation_name,
                 )
-                if order.is_paid:
-                    self.tickets_by_key[ticket.key].append(ticket)
-                elif ticket.key in self.tickets_by_key:  # remove cancelled tickets
-                    self.tickets_by_key.pop(ticket.key)
+                # index by the order-independent key for single lookups, and by the ticket key
+                # for names whose parts are split differently (e.g. 'Mary-Jane' vs 'Mary Jane')
+                keys = {generate_lookup_key(order=ticket.order, name=ticket.name), ticket.key}
+                for key in keys:
+                    self.tickets_by_key[key] = (*self.tickets_by_key.get(key, ()), ticket)
+                    self._keys_by_order[order.id].add(key)
+
+        return order_count
 
     async def _fetch_pretix_items(self) -> None:
         """Fetch all items from the Pretix API."""
         _logger.info("Fetching all pretix items")
         items_as_json = await self._fetch_all_pages(f"{self._pretix_api_url}/items")
 
-        for item_as_json in items_as_json:
-            item = PretixItem(**item_as_json)
+        for item in _ITEMS_ADAPTER.validate_python(items_as_json):
             self.item_names_by_id[item.id] = item.names_by_locale["en"]
             for variation in item.variations:
                 self.item_names_by_id[variation.id] = variation.names_by_locale["en"]
@@ -131,49 +194,79 @@ class PretixConnector:
         # https://docs.pretix.eu/en/latest/api/fundamentals.html#pagination
         _logger.debug("Fetching all pages from %s (params: %r)", url, params)
 
-        results = []
         start = time.perf_counter()
-        async with aiohttp.ClientSession(headers=self._http_headers) as session:
-            next_url: str | None = url
+        data = await self._fetch_page(url, params=params)
+        results = data["results"]
+
+        page_size = len(results)
+        if data["next"] is not None and "count" in data and page_size:
+            # the total count is known after the first page, so fetch the remaining pages
+            # concurrently instead of following the 'next' links one by one
+            page_count = math.ceil(data["count"] / page_size)
+            semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PAGE_FETCHES)
+
+            async def fetch_page(page: int) -> dict:
+                async with semaphore:
+                    return await self._fetch_page(url, params={**(params or {}), "page": str(page)})
+
+            pages = await asyncio.gather(*(fetch_page(page) for page in range(2, page_count + 1)))
+            for page_data in pages:
+                results.extend(page_data["results"])
+        else:
+            next_url: str | None = data["next"]
             while next_url is not None:
-                _logger.debug("Fetching %s", url)
-
-                # only send params on initial request
-                if next_url != url:
-                    params = None
-
-                async with session.get(next_url, params=params, timeout=5) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-                page_results = data["results"]
-                results.extend(page_results)
-                _logger.debug("Found %d items", len(page_results))
-
+                data = await self._fetch_page(next_url)
+                results.extend(data["results"])
                 next_url = data["next"]
 
         _logger.info("Fetched %d results in %.3f s", len(results), time.perf_counter() - start)
         return results
 
+    async def _fetch_page(self, url: str, params: dict[str, str] | None = None) -> dict:
+        """Fetch a single page from the Pretix API."""
+        _logger.debug("Fetching %s (params: %r)", url, params)
+
+        async with self._get_session().get(url, params=params, timeout=5) as response:
+            response.raise_for_status()
+            data = from_json(await response.read())
+
+        _logger.debug("Found %d items", len(data["results"]))
+        return data
+
     def get_tickets(self, *, order: str, name: str) -> list[Ticket]:
         """Get the tickets for a given order ID and name, or None if none was found."""
         _logger.debug("Lookup for order '%s' and name '%s'", order, name)
+        order, lookup_key = _get_lookup_key(order, name)
+        if lookup_key in self.tickets_by_key:
+            return list(self.tickets_by_key[lookup_key])
+
+        # the lookup key depends on how the name is split into parts (e.g. 'Mary-Jane' vs
+        # 'Mary Jane'), so fall back to the ticket keys, which ignore the name parts
+        for key in _generate_ticket_keys(order, name):
+            if key in self.tickets_by_key:
+                return list(self.tickets_by_key[key])
+        return []
 
-        # convert ticket ID to order ID ('#ABC01-1' -> 'ABC01')
-        order = order.lstrip("#")
-        order = order.split("-")[0]
-        order = order.upper()
 
-        # try different name orders (e.g. family name first vs last)
-        # prevent abuse by limiting the number of possible permutations to test
-        max_name_components = 5
-        name_parts = name.split(maxsplit=max_name_components - 1)
-        for permutation in itertools.permutations(name_parts):
-            possible_name = " ".join(permutation)
+@functools.lru_cache(maxsize=4096)
+def _get_lookup_key(order: str, name: str) -> tuple[str, str]:
+    """Get the order ID and lookup key for a ticket ID or order ID and name entered by a user.
 
-            key = generate_ticket_key(order=order, name=possible_name)
+    Users tend to retry with the same input, so the keys are cached.
+    """
+    # convert ticket ID to order ID ('#ABC01-1' -> 'ABC01')
+    order = order.lstrip("#")
+    order = order.split("-")[0]
+    order = order.upper()
 
-            if key in self.tickets_by_key:
-                return self.tickets_by_key[key]
+    # the lookup key does not depend on the name order (e.g. family name first vs last)
+    return order, generate_lookup_key(order=order, name=name)
 
-        return []
+
+def _generate_ticket_keys(order: str, name: str) -> Iterator[str]:
+    """Generate the ticket keys of all orders of the name parts, e.g. family name first."""
+    # prevent abuse by limiting the number of possible permutations to test
+    max_name_components = 5
+    name_parts = name.split(maxsplit=max_name_components - 1)
+    for permutation in itertools.permutations(name_parts):
+        yield generate_ticket_key(order=order, name=" ".join(permutation))
@@ -21,7 +21,7 @@ class RegistrationLogger:
         if log_file.exists():
             ticket_keys = log_file.read_text().splitlines()
             self._registered_ticket_keys.update(ticket_keys)
-            _logger.info(f"Loaded {len(ticket_keys)} previously registered tickets")
+            _logger.info("Loaded %d previously registered tickets", len(ticket_keys))
         else:
             _logger.info("File not found, starting with a fresh registration log (%s)", log_file)
 
@@ -32,7 +32,7 @@ class RegistrationLogger:
     async def mark_as_registered(self, ticket: Ticket) -> None:
         """Mark a ticket as registered. Raise ValueError if it was registered before."""
         async with self._registration_lock:
-            _logger.info(f"Marking ticket as registered: {ticket}")
+            _logger.info("Marking ticket as registered: %s", ticket)
 
             if self.is_registered(ticket):
                 raise ValueError(f"Ticket {ticket} is already registered")
@@ -1,10 +1,20 @@
 import string
+from dataclasses import dataclass, field
 
-from pydantic import BaseModel, ConfigDict, computed_field
 from unidecode import unidecode
 
 
 def generate_ticket_key(*, order: str, name: str) -> str:
+    return f"{order}-{_normalize_name(name)}"
+
+
+def generate_lookup_key(*, order: str, name: str) -> str:
+    # sort the name parts to ignore the name order (e.g. family name first vs last)
+    name_parts = sorted(_normalize_name(name_part) for name_part in name.split())
+    return f"{order}-{''.join(name_parts)}"
+
+
+def _normalize_name(name: str) -> str:
     # convert to ascii string (remove accents, split digraphs, ...)
     name = unidecode(name)
 
@@ -13,17 +23,18 @@ def generate_ticket_key(*, order: str, name: str) -> str:
     name = "".join(c for c in name if not c.isspace())
     name = "".join(c for c in name if c not in string.punctuation)
 
-    return f"{order}-{name}"
-
+    return name
 
-class Ticket(BaseModel):
-    model_config = ConfigDict(frozen=True)
 
+@dataclass(frozen=True, slots=True)
+class Ticket:
     order: str
     name: str
     type: str
     variation: str | None
 
-    @computed_field
-    def key(self) -> str:
-        return generate_ticket_key(order=self.order, name=self.name)
+    # computed once instead of on every access, not part of the serialized data
+    key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "key", generate_ticket_key(order=self.order, name=self.name))
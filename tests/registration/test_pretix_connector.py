@@ -1,5 +1,6 @@
+import asyncio
 import json
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
@@ -18,13 +19,22 @@ from registration.ticket import Ticket
 mock_items_file = Path(__file__).parent / "mock_pretix_items.json"
 mock_orders_file = Path(__file__).parent / "mock_pretix_orders.json"
 
+# read once, the mock responses are served from the raw bytes without re-encoding
+mock_items_body = mock_items_file.read_bytes()
+mock_orders_body = mock_orders_file.read_bytes()
+
 PRETIX_API_TOKEN = "MY_PRETIX_API_TOKEN"
 
 
+def mock_json_response(body: bytes) -> Response:
+    return web.Response(body=body, content_type="application/json")
+
+
 @dataclass
 class PretixMock:
     base_url: str
     requests: list[Request]
+    client_addresses: set[tuple[str, int]]
 
 
 async def create_pretix_app_mock(
@@ -42,12 +52,14 @@ async def create_pretix_app_mock(
     :param aiohttp_client: Test client generator (fixture from 'pytest-aiohttp')
     :param unused_tcp_port_factory: Random port generator (fixture from 'pytest-asyncio')
     """
-    # store all requests to allow introspection
+    # store all requests and client addresses (one per connection) to allow introspection
     requests: list[Request] = []
+    client_addresses: set[tuple[str, int]] = set()
 
     def make_handler(response_factory):
         async def handler_(request_: Request) -> Response:
             requests.append(request_)
+            client_addresses.add(request_.transport.get_extra_info("peername"))
             return response_factory()
 
         return handler_
@@ -61,19 +73,33 @@ async def create_pretix_app_mock(
     server = TestServer(app, port=port)
     client = await aiohttp_client(server)  # start server
 
-    return PretixMock(base_url=str(client.make_url("")), requests=requests)
+    return PretixMock(
+        base_url=str(client.make_url("")), requests=requests, client_addresses=client_addresses
+    )
+
+
+@pytest.fixture()
+async def create_pretix_connector() -> AsyncIterator[Callable[..., PretixConnector]]:
+    """Create Pretix connectors, and close their HTTP sessions after the test."""
+    connectors: list[PretixConnector] = []
+
+    def create_pretix_connector_(**kwargs) -> PretixConnector:
+        connector = PretixConnector(**kwargs)
+        connectors.append(connector)
+        return connector
+
+    yield create_pretix_connector_
+
+    for connector in connectors:
+        await connector.close()
 
 
 @pytest.fixture()
 async def pretix_mock(aiohttp_client, unused_tcp_port_factory) -> PretixMock:
     return await create_pretix_app_mock(
         response_factories={
-            "/items": lambda: web.json_response(
-                json.loads(mock_items_file.read_text(encoding="UTF-8"))
-            ),
-            "/orders": lambda: web.json_response(
-                json.loads(mock_orders_file.read_text(encoding="UTF-8"))
-            ),
+            "/items": lambda: mock_json_response(mock_items_body),
+            "/orders": lambda: mock_json_response(mock_orders_body),
         },
         aiohttp_client=aiohttp_client,
         unused_tcp_port_factory=unused_tcp_port_factory,
@@ -81,8 +107,8 @@ async def pretix_mock(aiohttp_client, unused_tcp_port_factory) -> PretixMock:
 
 
 @pytest.mark.asyncio
-async def test_pretix_items(pretix_mock):
-    pretix_connector = PretixConnector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+async def test_pretix_items(pretix_mock, create_pretix_connector):
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
 
     await pretix_connector.fetch_pretix_data()
 
@@ -98,26 +124,66 @@ async def test_pretix_items(pretix_mock):
 
 
 @pytest.mark.asyncio
-async def test_pretix_orders(pretix_mock):
-    pretix_connector = PretixConnector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+async def test_pretix_orders(pretix_mock, create_pretix_connector):
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
 
     await pretix_connector.fetch_pretix_data()
 
     assert pretix_connector.tickets_by_key == {
-        "BR7UH-evanovakova": [
-            Ticket(order="BR7UH", name="Eva Nováková", type="Business", variation="Conference")
-        ],
-        "BR7UH-jannovak": [
-            Ticket(order="BR7UH", name="Jan Novák", type="Business", variation="Tutorials")
-        ],
-        "RCZN9-maijameikalainen": [
-            Ticket(order="RCZN9", name="Maija Meikäläinen", type="Personal", variation=None)
-        ],
+        "BR7UH-evanovakova": (
+            Ticket(order="BR7UH", name="Eva Nováková", type="Business", variation="Conference"),
+        ),
+        "BR7UH-jannovak": (
+            Ticket(order="BR7UH", name="Jan Novák", type="Business", variation="Tutorials"),
+        ),
+        "RCZN9-maijameikalainen": (
+            Ticket(order="RCZN9", name="Maija Meikäläinen", type="Personal", variation=None),
+        ),
     }
 
 
-async def test_get_ticket(pretix_mock):
-    pretix_connector = PretixConnector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+async def test_tickets_are_indexed_by_lookup_key_and_ticket_key(
+    aiohttp_client, unused_tcp_port_factory, create_pretix_connector
+):
+    pretix_mock = await create_pretix_app_mock(
+        response_factories={
+            "/items": lambda: mock_json_response(mock_items_body),
+            "/orders": lambda: web.json_response(
+                {
+                    "next": None,
+                    "results": [
+                        {
+                            "code": "ABC01",
+                            "status": "p",
+                            "positions": [
+                                {
+                                    "order": "ABC01",
+                                    "item": 339041,
+                                    "variation": None,
+                                    "attendee_name": "Jane Doe",  # name parts not sorted
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ),
+        },
+        aiohttp_client=aiohttp_client,
+        unused_tcp_port_factory=unused_tcp_port_factory,
+    )
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+
+    await pretix_connector.fetch_pretix_data()
+
+    ticket = Ticket(order="ABC01", name="Jane Doe", type="Business", variation=None)
+    assert pretix_connector.tickets_by_key == {
+        "ABC01-doejane": (ticket,),  # sorted name parts
+        "ABC01-janedoe": (ticket,),  # name as written
+    }
+
+
+async def test_get_ticket(pretix_mock, create_pretix_connector):
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
 
     await pretix_connector.fetch_pretix_data()
 
@@ -128,8 +194,8 @@ async def test_get_ticket(pretix_mock):
     ]
 
 
-async def test_cache(pretix_mock, tmp_path):
-    pretix_connector_1 = PretixConnector(
+async def test_cache(pretix_mock, tmp_path, create_pretix_connector):
+    pretix_connector_1 = create_pretix_connector(
         url=pretix_mock.base_url, token=PRETIX_API_TOKEN, cache_file=tmp_path / "pretix_cache.json"
     )
     assert not pretix_connector_1.item_names_by_id
@@ -140,15 +206,48 @@ async def test_cache(pretix_mock, tmp_path):
     assert pretix_connector_1.item_names_by_id
     assert pretix_connector_1.tickets_by_key
 
-    pretix_connector_2 = PretixConnector(
+    pretix_connector_2 = create_pretix_connector(
         url=pretix_mock.base_url, token=PRETIX_API_TOKEN, cache_file=tmp_path / "pretix_cache.json"
     )
     assert pretix_connector_1.item_names_by_id == pretix_connector_2.item_names_by_id
     assert pretix_connector_1.tickets_by_key == pretix_connector_2.tickets_by_key
 
 
-async def test_get_ticket_handles_ticket_ids(pretix_mock):
-    pretix_connector = PretixConnector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+async def test_cache_is_not_rewritten_without_updates(
+    aiohttp_client, unused_tcp_port_factory, tmp_path, create_pretix_connector
+):
+    order_pages = iter(
+        [
+            json.loads(mock_orders_body),
+            {"next": None, "results": []},  # no orders modified since the first fetch
+        ]
+    )
+    pretix_mock = await create_pretix_app_mock(
+        response_factories={
+            "/items": lambda: mock_json_response(mock_items_body),
+            "/orders": lambda: web.json_response(next(order_pages)),
+        },
+        aiohttp_client=aiohttp_client,
+        unused_tcp_port_factory=unused_tcp_port_factory,
+    )
+    cache_file = tmp_path / "pretix_cache.json"
+    pretix_connector = create_pretix_connector(
+        url=pretix_mock.base_url, token=PRETIX_API_TOKEN, cache_file=cache_file
+    )
+
+    await pretix_connector.fetch_pretix_data()
+    assert cache_file.exists()
+
+    # fetch updates after >2 minutes
+    cache_file.unlink()
+    pretix_connector._last_fetch -= timedelta(minutes=3)
+    await pretix_connector.fetch_pretix_data()
+
+    assert not cache_file.exists()
+
+
+async def test_get_ticket_handles_ticket_ids(pretix_mock, create_pretix_connector):
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
 
     await pretix_connector.fetch_pretix_data()
 
@@ -159,8 +258,8 @@ async def test_get_ticket_handles_ticket_ids(pretix_mock):
     ]
 
 
-async def test_get_ticket_ignores_accents(pretix_mock):
-    pretix_connector = PretixConnector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+async def test_get_ticket_ignores_accents(pretix_mock, create_pretix_connector):
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
 
     await pretix_connector.fetch_pretix_data()
 
@@ -171,8 +270,8 @@ async def test_get_ticket_ignores_accents(pretix_mock):
     ]
 
 
-async def test_get_ticket_ignores_name_order(pretix_mock):
-    pretix_connector = PretixConnector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+async def test_get_ticket_ignores_name_order(pretix_mock, create_pretix_connector):
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
 
     await pretix_connector.fetch_pretix_data()
 
@@ -183,8 +282,55 @@ async def test_get_ticket_ignores_name_order(pretix_mock):
     ]
 
 
-async def test_get_ticket_returns_none_on_unknown_input(pretix_mock):
-    pretix_connector = PretixConnector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+@pytest.mark.parametrize(
+    ("ticket_name", "input_name"),
+    [
+        ("Mary-Jane Smith", "Mary Jane Smith"),
+        ("Mary-Jane Smith", "Smith Mary Jane"),
+        ("Jan van der Berg", "Jan Vanderberg"),
+        ("Jan van der Berg", "Vanderberg Jan"),
+    ],
+)
+async def test_get_ticket_ignores_name_parts(
+    aiohttp_client, unused_tcp_port_factory, ticket_name, input_name, create_pretix_connector
+):
+    pretix_mock = await create_pretix_app_mock(
+        response_factories={
+            "/items": lambda: mock_json_response(mock_items_body),
+            "/orders": lambda: web.json_response(
+                {
+                    "next": None,
+                    "results": [
+                        {
+                            "code": "ABC01",
+                            "status": "p",
+                            "positions": [
+                                {
+                                    "order": "ABC01",
+                                    "item": 339041,
+                                    "variation": None,
+                                    "attendee_name": ticket_name,
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ),
+        },
+        aiohttp_client=aiohttp_client,
+        unused_tcp_port_factory=unused_tcp_port_factory,
+    )
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+
+    await pretix_connector.fetch_pretix_data()
+
+    tickets = pretix_connector.get_tickets(order="ABC01", name=input_name)
+
+    assert tickets == [Ticket(order="ABC01", name=ticket_name, type="Business", variation=None)]
+
+
+async def test_get_ticket_returns_none_on_unknown_input(pretix_mock, create_pretix_connector):
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
 
     await pretix_connector.fetch_pretix_data()
 
@@ -193,8 +339,8 @@ async def test_get_ticket_returns_none_on_unknown_input(pretix_mock):
     assert tickets == []
 
 
-async def test_get_ticket_ignores_unpaid_orders(pretix_mock):
-    pretix_connector = PretixConnector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+async def test_get_ticket_ignores_unpaid_orders(pretix_mock, create_pretix_connector):
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
 
     await pretix_connector.fetch_pretix_data()
 
@@ -203,12 +349,12 @@ async def test_get_ticket_ignores_unpaid_orders(pretix_mock):
     assert tickets == []
 
 
-async def test_positions_without_name_are_ignored(aiohttp_client, unused_tcp_port_factory):
+async def test_positions_without_name_are_ignored(
+    aiohttp_client, unused_tcp_port_factory, create_pretix_connector
+):
     pretix_mock = await create_pretix_app_mock(
         response_factories={
-            "/items": lambda: web.json_response(
-                json.loads(mock_items_file.read_text(encoding="UTF-8"))
-            ),
+            "/items": lambda: mock_json_response(mock_items_body),
             "/orders": lambda: web.json_response(
                 {
                     "next": None,
@@ -233,14 +379,14 @@ async def test_positions_without_name_are_ignored(aiohttp_client, unused_tcp_por
         unused_tcp_port_factory=unused_tcp_port_factory,
     )
 
-    pretix_connector = PretixConnector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
 
     await pretix_connector.fetch_pretix_data()
 
     assert pretix_connector.tickets_by_key == {}
 
 
-async def test_pagination(aiohttp_client, unused_tcp_port_factory):
+async def test_pagination(aiohttp_client, unused_tcp_port_factory, create_pretix_connector):
     # split items response into two pages
     port = unused_tcp_port_factory()
     base_url = f"http://127.0.0.1:{port}"
@@ -279,16 +425,14 @@ async def test_pagination(aiohttp_client, unused_tcp_port_factory):
                     ],
                 }
             ),
-            "/orders": lambda: web.json_response(
-                json.loads(mock_orders_file.read_text(encoding="UTF-8"))
-            ),
+            "/orders": lambda: mock_json_response(mock_orders_body),
         },
         port=port,
         aiohttp_client=aiohttp_client,
         unused_tcp_port_factory=unused_tcp_port_factory,
     )
 
-    pretix_connector = PretixConnector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
     await pretix_connector.fetch_pretix_data()
 
     assert (
@@ -296,9 +440,66 @@ async def test_pagination(aiohttp_client, unused_tcp_port_factory):
     ), "Only the first page of '/items' was fetched."
 
 
+async def test_pagination_with_page_count(
+    aiohttp_client, unused_tcp_port_factory, create_pretix_connector
+):
+    # split items response into two pages, announcing the total count on the first page
+    port = unused_tcp_port_factory()
+    base_url = f"http://127.0.0.1:{port}"
+
+    item_pages = iter(
+        [
+            {
+                "count": 2,
+                "next": f"{base_url}/items?page=2",
+                "results": [
+                    {
+                        "id": 339041,
+                        "name": {"en": "Business"},
+                        "variations": [
+                            {"id": 163246, "value": {"en": "Conference"}},
+                            {"id": 163247, "value": {"en": "Tutorials"}},
+                        ],
+                    }
+                ],
+            },
+            {
+                "count": 2,
+                "next": None,
+                "results": [
+                    {
+                        "id": 339042,
+                        "name": {"en": "Personal"},
+                        "variations": [
+                            {"id": 163253, "value": {"en": "Combined (Conference + Tutorials)"}},
+                        ],
+                    }
+                ],
+            },
+        ]
+    )
+
+    pretix_mock = await create_pretix_app_mock(
+        {
+            "/items": lambda: web.json_response(next(item_pages)),
+            "/orders": lambda: mock_json_response(mock_orders_body),
+        },
+        port=port,
+        aiohttp_client=aiohttp_client,
+        unused_tcp_port_factory=unused_tcp_port_factory,
+    )
+
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+    await pretix_connector.fetch_pretix_data()
+
+    assert len(pretix_connector.item_names_by_id) == 5
+    assert pretix_mock.requests[1].url.path == "/items"
+    assert pretix_mock.requests[1].url.query["page"] == "2"
+
+
 @pytest.mark.asyncio
-async def test_consecutive_fetches_are_prevented(pretix_mock):
-    pretix_connector = PretixConnector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+async def test_consecutive_fetches_are_prevented(pretix_mock, create_pretix_connector):
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
     requests = pretix_mock.requests
 
     # initial fetch should fetch everything
@@ -316,8 +517,19 @@ async def test_consecutive_fetches_are_prevented(pretix_mock):
 
 
 @pytest.mark.asyncio
-async def test_consecutive_fetches_after_some_time_fetch_updates(pretix_mock):
-    pretix_connector = PretixConnector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+async def test_concurrent_fetches_fetch_once(pretix_mock, create_pretix_connector):
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+
+    await asyncio.gather(*(pretix_connector.fetch_pretix_data() for _ in range(3)))
+
+    assert len(pretix_mock.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_consecutive_fetches_after_some_time_fetch_updates(
+    pretix_mock, create_pretix_connector
+):
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
     requests = pretix_mock.requests
 
     initial_time = datetime.now(tz=timezone.utc)
@@ -342,23 +554,39 @@ async def test_consecutive_fetches_after_some_time_fetch_updates(pretix_mock):
     assert datetime.fromisoformat(requests[1].url.query["modified_since"]) == three_minutes_before
 
 
+async def test_updated_orders_do_not_duplicate_tickets(pretix_mock, create_pretix_connector):
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+
+    await pretix_connector.fetch_pretix_data()
+
+    # fetch updates after >2 minutes, which returns the same orders again
+    pretix_connector._last_fetch -= timedelta(minutes=3)
+    await pretix_connector.fetch_pretix_data()
+
+    tickets = pretix_connector.get_tickets(order="BR7UH", name="Eva Nováková")
+
+    assert tickets == [
+        Ticket(order="BR7UH", name="Eva Nováková", type="Business", variation="Conference")
+    ]
+
+
 @pytest.mark.asyncio
-async def test_api_error_responses_are_raised(aiohttp_client, unused_tcp_port_factory):
+async def test_api_error_responses_are_raised(
+    aiohttp_client, unused_tcp_port_factory, create_pretix_connector
+):
     pretix_mock = await create_pretix_app_mock(
         response_factories={
             "/items": lambda: web.json_response(
                 {"error": "Crash"},
                 status=HTTPStatus.INTERNAL_SERVER_ERROR,
             ),
-            "/orders": lambda: web.json_response(
-                json.loads(mock_orders_file.read_text(encoding="UTF-8"))
-            ),
+            "/orders": lambda: mock_json_response(mock_orders_body),
         },
         aiohttp_client=aiohttp_client,
         unused_tcp_port_factory=unused_tcp_port_factory,
     )
 
-    pretix_connector = PretixConnector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
 
     with pytest.raises(aiohttp.ClientResponseError) as e:
         await pretix_connector.fetch_pretix_data()
@@ -367,7 +595,7 @@ async def test_api_error_responses_are_raised(aiohttp_client, unused_tcp_port_fa
 
 
 @pytest.mark.asyncio
-async def test_multiple_tickets(aiohttp_client, unused_tcp_port_factory):
+async def test_multiple_tickets(aiohttp_client, unused_tcp_port_factory, create_pretix_connector):
     pretix_mock = await create_pretix_app_mock(
         {
             "/items": lambda: web.json_response(
@@ -409,7 +637,7 @@ async def test_multiple_tickets(aiohttp_client, unused_tcp_port_factory):
         unused_tcp_port_factory=unused_tcp_port_factory,
     )
 
-    pretix_connector = PretixConnector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
     await pretix_connector.fetch_pretix_data()
 
     tickets = pretix_connector.get_tickets(order="BR7UH", name="Jane Doe")
@@ -420,41 +648,140 @@ async def test_multiple_tickets(aiohttp_client, unused_tcp_port_factory):
     }
 
 
-async def test_cancelled_orders_are_removed(aiohttp_client, unused_tcp_port_factory):
+async def test_cancelled_orders_are_removed(
+    aiohttp_client, unused_tcp_port_factory, create_pretix_connector
+):
+    order_pages = iter(
+        [
+            {
+                "next": None,
+                "results": [
+                    {
+                        "code": "ABC01",
+                        "status": "p",  # paid
+                        "positions": [
+                            {
+                                "order": "ABC01",
+                                "item": 339041,
+                                "variation": None,
+                                "attendee_name": "Jane Doe",
+                            }
+                        ],
+                    }
+                ],
+            },
+            {
+                "next": None,
+                "results": [
+                    {
+                        "code": "ABC01",
+                        "status": "c",  # cancelled
+                        "positions": [
+                            {
+                                "order": "ABC01",
+                                "item": 339041,
+                                "variation": None,
+                                "attendee_name": "Jane Doe",
+                            }
+                        ],
+                    }
+                ],
+            },
+        ]
+    )
     pretix_mock = await create_pretix_app_mock(
         response_factories={
-            "/items": lambda: web.json_response(json.loads(mock_items_file.read_text())),
-            "/orders": lambda: web.json_response(
-                {
-                    "next": None,
-                    "results": [
-                        {
-                            "code": "ABC01",
-                            "status": "c",  # cancelled
-                            "positions": [
-                                {
-                                    "order": "ABC01",
-                                    "item": 339041,
-                                    "variation": None,
-                                    "attendee_name": "Jane Doe",
-                                }
-                            ],
-                        }
-                    ],
-                }
-            ),
+            "/items": lambda: mock_json_response(mock_items_body),
+            "/orders": lambda: web.json_response(next(order_pages)),
         },
         aiohttp_client=aiohttp_client,
         unused_tcp_port_factory=unused_tcp_port_factory,
     )
 
-    pretix_connector = PretixConnector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
 
-    # insert previously paid ticket
-    ticket = Ticket(order="ABC01", name="Jane Doe", type="Business", variation=None)
-    pretix_connector.tickets_by_key[ticket.key] = [ticket]
+    # initial fetch: ticket was paid
+    await pretix_connector.fetch_pretix_data()
+    assert pretix_connector.get_tickets(order="ABC01", name="Jane Doe")
 
-    # fetch pretix data: ticket was cancelled
+    # fetch updates after >2 minutes: ticket was cancelled
+    pretix_connector._last_fetch -= timedelta(minutes=3)
     await pretix_connector.fetch_pretix_data()
 
     assert pretix_connector.tickets_by_key == {}
+
+
+async def test_modified_orders_replace_tickets(
+    aiohttp_client, unused_tcp_port_factory, create_pretix_connector
+):
+    order_pages = iter(
+        [
+            {
+                "next": None,
+                "results": [
+                    {
+                        "code": "ABC01",
+                        "status": "p",
+                        "positions": [
+                            {
+                                "order": "ABC01",
+                                "item": 339041,
+                                "variation": 163246,  # Conference
+                                "attendee_name": "Jane Do",
+                            }
+                        ],
+                    }
+                ],
+            },
+            {
+                "next": None,
+                "results": [
+                    {
+                        "code": "ABC01",
+                        "status": "p",
+                        "positions": [
+                            {
+                                "order": "ABC01",
+                                "item": 339041,
+                                "variation": 163247,  # changed to Tutorials
+                                "attendee_name": "Jane Doe",  # corrected name
+                            }
+                        ],
+                    }
+                ],
+            },
+        ]
+    )
+    pretix_mock = await create_pretix_app_mock(
+        response_factories={
+            "/items": lambda: mock_json_response(mock_items_body),
+            "/orders": lambda: web.json_response(next(order_pages)),
+        },
+        aiohttp_client=aiohttp_client,
+        unused_tcp_port_factory=unused_tcp_port_factory,
+    )
+
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+    await pretix_connector.fetch_pretix_data()
+
+    # fetch updates after >2 minutes: the order was modified
+    pretix_connector._last_fetch -= timedelta(minutes=3)
+    await pretix_connector.fetch_pretix_data()
+
+    assert pretix_connector.get_tickets(order="ABC01", name="Jane Do") == []
+    assert pretix_connector.get_tickets(order="ABC01", name="Jane Doe") == [
+        Ticket(order="ABC01", name="Jane Doe", type="Business", variation="Tutorials")
+    ]
+
+
+async def test_http_connection_is_reused_between_fetches(pretix_mock, create_pretix_connector):
+    pretix_connector = create_pretix_connector(url=pretix_mock.base_url, token=PRETIX_API_TOKEN)
+
+    await pretix_connector.fetch_pretix_data()
+
+    # force a second fetch
+    pretix_connector._last_fetch = None
+    await pretix_connector.fetch_pretix_data()
+
+    assert len(pretix_mock.requests) == 4
+    assert len(pretix_mock.client_addresses) == 1
@@ -1,6 +1,6 @@
 import pytest
 
-from registration.ticket import generate_ticket_key
+from registration.ticket import generate_lookup_key, generate_ticket_key
 
 
 @pytest.mark.parametrize(
@@ -16,3 +16,21 @@ from registration.ticket import generate_ticket_key
 def test_name_normalization(name: str, result: str) -> None:
     key = generate_ticket_key(order="ABC01", name=name)
     assert key == f"ABC01-{result}"
+
+
+def test_lookup_key_ignores_name_order() -> None:
+    key = generate_lookup_key(order="ABC01", name="Maija Meikäläinen")
+    assert key == generate_lookup_key(order="ABC01", name="Meikäläinen Maija")
+    assert key == generate_lookup_key(order="ABC01", name="  meikalainen   MAIJA ")
+
+
+@pytest.mark.parametrize(
+    ("ticket_name", "input_name"),
+    [
+        ("Mary-Jane Smith", "Mary Jane Smith"),
+        ("Jan van der Berg", "Jan Vanderberg"),
+    ],
+)
+def test_ticket_key_ignores_name_parts(ticket_name: str, input_name: str) -> None:
+    key = generate_ticket_key(order="ABC01", name=ticket_name)
+    assert key == generate_ticket_key(order="ABC01", name=input_name)